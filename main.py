@@ -3,34 +3,119 @@
 Interactive GitHub Activity CLI
 Prompts for username and optional token, then fetches recent events.
 
-Requirements: Only Python standard library.
+Requirements: Only Python standard library (orjson is used if installed).
 """
 
+import gzip
+import hashlib
 import json
+import os
+import tempfile
+import urllib.parse
 import urllib.request
 import urllib.error
+import zlib
+from itertools import islice
+from pathlib import Path
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+_BASE_HEADERS = {
+    "User-Agent": "github-activity-cli/1.0",
+    "Accept": "application/vnd.github.v3+json",
+    "Accept-Encoding": "gzip",
+}
+
+
+def _cache_path(username, token=None):
+    """Return the cache file for username; raises RuntimeError if there is no home.
+
+    Authenticated responses may include private events, so they are kept
+    apart per token (by digest, never the token itself).
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    name = urllib.parse.quote(username, safe="")
+    if token:
+        name += "-" + hashlib.blake2b(token.encode(), digest_size=16).hexdigest()
+    return Path(cache_home) / "github-activity-cli" / f"{name}.json"
 
-API_URL = "https://api.github.com/users/{username}/events"
 
+def _load_cache(username, token=None):
+    """Return (etag, body) from the on-disk cache, or (None, None)."""
+    try:
+        etag, _, body = _cache_path(username, token).read_bytes().partition(b"\n")
+        etag = etag.decode("ascii")
+        if not etag.isprintable():
+            raise ValueError("invalid ETag in cache")
+        return etag, body
+    except (OSError, RuntimeError, ValueError):
+        return None, None
 
-def fetch_events(username, token=None, timeout=10):
-    """Fetch events for the given username. Returns a list of events."""
-    url = API_URL.format(username=username)
-    req = urllib.request.Request(url)
-    req.add_header("User-Agent", "github-activity-cli/1.0")
-    req.add_header("Accept", "application/vnd.github.v3+json")
-    if token:
-        req.add_header("Authorization", f"token {token}")
 
+def _save_cache(username, token, etag, body):
+    """Atomically store the ETag and raw body, readable only by the owner.
+
+    Failures are not fatal.
+    """
+    tmp = None
+    try:
+        path = _cache_path(username, token)
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        data = etag.encode("ascii") + b"\n" + body
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except (OSError, RuntimeError, ValueError):
+        if tmp is not None:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+
+
+def _read_body(resp):
+    """Read a response body, inflating it if the server sent gzip."""
+    body = resp.read()
+    if resp.headers.get("Content-Encoding") == "gzip":
+        body = gzip.decompress(body)
+    return body
+
+
+def _drop_cache(username, token=None):
+    """Remove a cache entry that could not be used; failures are not fatal."""
+    try:
+        _cache_path(username, token).unlink()
+    except (OSError, RuntimeError):
+        pass
+
+
+def _request_events(url, headers, timeout, username, token):
+    """GET the events, caching the body on success. Returns None on 304."""
+    req = urllib.request.Request(url, headers=headers)
     try:
         with urllib.request.urlopen(req, timeout=timeout) as resp:
-            body = resp.read().decode("utf-8")
-            return json.loads(body)
+            try:
+                body = _read_body(resp)
+            except (OSError, EOFError, zlib.error) as e:
+                raise RuntimeError(f"Could not read response: {e}")
+            try:
+                events = _loads(body)
+            except ValueError as e:
+                raise RuntimeError(f"Invalid JSON response: {e}")
+            new_etag = resp.headers.get("ETag")
+            if new_etag:
+                _save_cache(username, token, new_etag, body)
+            return events
     except urllib.error.HTTPError as e:
+        if e.code == 304 and "If-None-Match" in headers:
+            return None
         try:
-            err_body = e.read().decode("utf-8")
-            err_json = json.loads(err_body)
-            message = err_json.get("message", err_body)
+            message = _loads(_read_body(e)).get("message") or e.reason
         except Exception:
             message = e.reason
         raise RuntimeError(f"HTTP {e.code}: {message}")
@@ -38,27 +123,66 @@ def fetch_events(username, token=None, timeout=10):
         raise RuntimeError(f"Network error: {e.reason}")
 
 
+def fetch_events(username, token=None, timeout=10):
+    """Fetch events for the given username. Returns a list of events."""
+    url = f"https://api.github.com/users/{urllib.parse.quote(username, safe='')}/events"
+    headers = _BASE_HEADERS
+    if token:
+        headers = {**headers, "Authorization": f"token {token}"}
+
+    etag, cached = _load_cache(username, token)
+    if etag:
+        conditional = {**headers, "If-None-Match": etag}
+        events = _request_events(url, conditional, timeout, username, token)
+        if events is not None:
+            return events
+        try:
+            return _loads(cached)
+        except ValueError:
+            # Damaged cache entry: drop it and fetch the full body again.
+            _drop_cache(username, token)
+    return _request_events(url, headers, timeout, username, token)
+
+
+_PLURAL = {1: ""}
+
+
+def _push(repo, payload):
+    size = payload.get("size", 0)
+    return f"Pushed {size} commit{_PLURAL.get(size, 's')} to {repo}"
+
+
+def _issues(repo, payload):
+    action = payload.get("action", "did something")
+    return f"{action.capitalize()} an issue in {repo}"
+
+
+def _create(repo, payload):
+    ref_type = payload.get("ref_type")
+    ref = payload.get("ref")
+    suffix = f" {ref}" if ref_type and ref else ""
+    return f"Created {ref_type}{suffix} in {repo}"
+
+
+_HANDLERS = {
+    "PushEvent": _push,
+    "IssuesEvent": _issues,
+    "WatchEvent": lambda repo, payload: f"Starred {repo}",
+    "ForkEvent": lambda repo, payload: f"Forked {repo}",
+    "CreateEvent": _create,
+}
+
+
 def summarize_event(ev):
     """Turn GitHub event into a readable summary."""
     typ = ev.get("type", "UnknownEvent")
     repo = ev.get("repo", {}).get("name", "<unknown>")
     payload = ev.get("payload", {})
 
-    if typ == "PushEvent":
-        size = payload.get("size", 0)
-        return f"Pushed {size} commit{'s' if size != 1 else ''} to {repo}"
-    elif typ == "IssuesEvent":
-        action = payload.get("action", "did something")
-        return f"{action.capitalize()} an issue in {repo}"
-    elif typ == "WatchEvent":
-        return f"Starred {repo}"
-    elif typ == "ForkEvent":
-        return f"Forked {repo}"
-    elif typ == "CreateEvent":
-        ref_type = payload.get("ref_type")
-        ref = payload.get("ref")
-        return f"Created {ref_type} {ref} in {repo}" if ref_type and ref else f"Created {ref_type} in {repo}"
-    return f"{typ} in {repo}"
+    handler = _HANDLERS.get(typ)
+    if handler is None:
+        return f"{typ} in {repo}"
+    return handler(repo, payload)
 
 
 def main():
@@ -85,7 +209,7 @@ def main():
         return
 
     print(f"\nRecent activity for {username}:\n")
-    for ev in events[:10]:  # Show first 10 events
+    for ev in islice(events, 10):  # Show first 10 events
         print(f"- {summarize_event(ev)}")
 
 